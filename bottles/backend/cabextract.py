@@ -38,9 +38,13 @@ class CabExtract:
     name: str
     files: list
     destination: str
+    __bin = None
 
     def __init__(self):
-        self.cabextract_bin = shutil.which("cabextract")
+        # the lookup is shared by all instances, it is retried until found
+        if CabExtract.__bin is None:
+            CabExtract.__bin = shutil.which("cabextract")
+        self.cabextract_bin = CabExtract.__bin
 
     def run(self, path: str, name: str = "", files: list = None, destination: str = ""):
         if files is None:
@@ -16,12 +16,14 @@
 #
 
 import os
+import time
 import uuid
 import shutil
+import fnmatch
 import patoolib
 from glob import glob
-from functools import lru_cache
-from typing import Union, NewType
+from concurrent.futures import ThreadPoolExecutor
+from typing import Union, NewType, NamedTuple, Callable
 from gi.repository import GLib
 
 try:
@@ -46,29 +48,164 @@ from bottles.backend.wine.executor import WineExecutor
 logging = Logger()
 
 
+class Step(NamedTuple):
+    """
+    A manifest step. The path field is the url with the temp/ prefix
+    resolved to the Bottles temp path, if any.
+    """
+    action: str
+    url: str = None
+    path: str = None
+    file_name: str = None
+    rename: str = None
+    file_checksum: str = None
+    source: str = None
+    dest: str = None
+    dlls: list = None
+    dll: str = None
+    fonts: list = None
+    font: str = None
+    replace: Union[str, list] = None
+    bundle: dict = None
+    arguments: str = None
+    environment: dict = None
+    key: str = None
+    value: str = None
+    data: str = None
+    type: str = None
+    name: str = None
+    file: str = None
+    version: str = None
+    executable: str = None
+
+
+def _compile_steps(steps: list) -> list:
+    """Convert the manifest steps into Step tuples, ignoring unknown keys."""
+    compiled = []
+
+    for step in steps:
+        fields = {k: v for k, v in step.items() if k in Step._fields}
+        url = fields.get("url")
+        if url and url.startswith("temp/"):
+            fields["path"] = url.replace("temp/", f"{Paths.temp}/")
+        else:
+            fields["path"] = url
+        compiled.append(Step(**fields))
+
+    return compiled
+
+
 class DependencyManager:
+    __MANIFEST_TTL = 300
 
     def __init__(self, manager, offline: bool = False):
         self.__manager = manager
+        self.__offline = offline
         self.__repo = manager.repository_manager.get_repo("dependencies", offline)
+        self.__repo_time = time.monotonic()
         self.__window = manager.window
         self.__utils_conn = manager.utils_conn
         self.__operation_manager = OperationManager(self.__window)
+        self.__manifest_cache = {}
+        self.__catalog_cache = None
+        self.__conn_status = self.__utils_conn.status
+        self.__copy_executor = ThreadPoolExecutor(max_workers=8)
+        self.__prefetch_executor = ThreadPoolExecutor(max_workers=16)
+        self.__step_dispatch = {
+            "delete_dlls": self.__step_delete_dlls,
+            "download_archive": self.__step_download_archive,
+            "install_exe": self.__step_install_exe_msi,
+            "install_msi": self.__step_install_exe_msi,
+            "uninstall": self.__step_uninstall,
+            "cab_extract": self.__step_cab_extract,
+            "get_from_cab": self.__step_get_from_cab,
+            "archive_extract": self.__step_archive_extract,
+            "install_cab_fonts": self.__step_install_fonts,
+            "install_fonts": self.__step_install_fonts,
+            "copy_dll": self.__step_copy_dll,
+            "copy_file": self.__step_copy_dll,
+            "register_dll": self.__step_register_dll,
+            "set_register_key": self.__step_set_register_key,
+            "register_font": self.__step_register_font,
+            "replace_font": self.__step_replace_font,
+            "set_windows": self.__step_set_windows,
+            "use_windows": self.__step_use_windows,
+        }
+        self.__no_uninstaller_actions = {
+            "cab_extract",
+            "get_from_cab",
+            "archive_extract",
+            "install_cab_fonts",
+            "install_fonts",
+            "copy_dll",
+            "copy_file",
+        }
+
+    def __check_cache(self):
+        """
+        Drop the cached manifests and catalog if the connection status
+        changed since the last lookup, so that stale (or empty) results
+        are not served after going online/offline.
+        """
+        status = self.__utils_conn.status
+        if status != self.__conn_status:
+            self.__conn_status = status
+            self.__manifest_cache.clear()
+            self.__catalog_cache = None
+
+    def __is_fresh(self, timestamp: float) -> bool:
+        return time.monotonic() - timestamp < self.__MANIFEST_TTL
+
+    def __get_manifest_key(self, name: str, plain: bool = False) -> tuple:
+        entry = self.__repo.catalog.get(name, {})
+        return entry.get("Category"), name, plain
 
-    @lru_cache
     def get_dependency(self, name: str, plain: bool = False) -> Union[str, dict]:
-        return self.__repo.get(name, plain)
+        """
+        Return the manifest of the given dependency. Manifests are kept
+        in memory for a short time to avoid fetching and parsing the same
+        manifest again when installing bundles of dependencies.
+        """
+        self.__check_cache()
+        key = self.__get_manifest_key(name, plain)
+
+        cached = self.__manifest_cache.get(key)
+        if cached and self.__is_fresh(cached[0]):
+            return cached[1]
+
+        manifest = self.__repo.get(name, plain)
+        if manifest:
+            self.__manifest_cache[key] = (time.monotonic(), manifest)
+        return manifest
 
-    @lru_cache
-    def fetch_catalog(self) -> dict:
+    def fetch_catalog(self, prefetch_manifests: bool = False) -> dict:
         """
         Fetch all dependencies from the Bottles repository
         and return these as a dictionary. It also returns an empty dictionary
         if there are no dependencies or fails to fetch them.
+        If prefetch_manifests is True, the manifests of all dependencies which
+        are not cached yet are fetched concurrently in background and stored
+        in the manifest cache, where they expire like any other manifest.
         """
+        self.__check_cache()
+        if self.__catalog_cache and self.__is_fresh(self.__catalog_cache[0]):
+            return self.__catalog_cache[1]
+
         if not self.__utils_conn.check_connection():
             return {}
 
+        if not self.__is_fresh(self.__repo_time) or not self.__repo.catalog:
+            '''
+            The index is loaded when the repository is created, so an
+            expired (or empty) one needs a new repository. Thanks to the
+            conditional requests this costs a 304 when the index did not
+            change.
+            '''
+            self.__repo = self.__manager.repository_manager.get_repo(
+                "dependencies", self.__offline
+            )
+            self.__repo_time = time.monotonic()
+
         catalog = {}
         index = self.__repo.catalog
 
@@ -76,8 +213,41 @@ class DependencyManager:
             catalog[dependency[0]] = dependency[1]
 
         catalog = dict(sorted(catalog.items()))
+        self.__catalog_cache = (time.monotonic(), catalog)
+
+        if prefetch_manifests:
+            self.__prefetch_manifests(catalog)
+
         return catalog
 
+    def __prefetch_manifests(self, catalog: dict):
+        """
+        Fetch the manifests of the given catalog using a pool of workers,
+        overlapping the network round-trips. This does not wait for the
+        workers to complete.
+        """
+        for name in catalog.keys():
+            if self.__get_manifest_key(name) not in self.__manifest_cache:
+                self.__prefetch_executor.submit(self.__prefetch_manifest, name)
+
+    def __prefetch_manifest(self, name: str):
+        key = self.__get_manifest_key(name)
+        if key in self.__manifest_cache:
+            return
+
+        manifest = self.__repo.get(name)
+        if manifest:
+            # don't replace an entry stored by get_dependency meanwhile
+            self.__manifest_cache.setdefault(key, (time.monotonic(), manifest))
+
+    def shutdown(self):
+        """
+        Stop the background workers, dropping the pending prefetches and
+        copies so they do not delay the application exit.
+        """
+        self.__prefetch_executor.shutdown(wait=False, cancel_futures=True)
+        self.__copy_executor.shutdown(wait=False, cancel_futures=True)
+
     def install(
             self,
             config: dict,
@@ -89,7 +259,6 @@ class DependencyManager:
         return True if the installation was successful.
         """
         task_id = str(uuid.uuid4())
-        uninstaller = True
 
         if config["Parameters"]["versioning_automatic"]:
             '''
@@ -106,6 +275,23 @@ class DependencyManager:
             self.__operation_manager.new_task, task_id, dependency[0], False
         )
 
+        try:
+            return self.__install(config, dependency, reinstall)
+        finally:
+            # Remove entry from operation manager, whatever the outcome
+            GLib.idle_add(self.__operation_manager.remove_task, task_id)
+
+    def __install(
+            self,
+            config: dict,
+            dependency: list,
+            reinstall: bool = False
+    ) -> Result:
+        """
+        Perform the installation of a dependency, see install().
+        """
+        uninstaller = True
+
         logging.info("Installing dependency [%s] in bottle [%s]." % (
             dependency[0],
             config['Name']
@@ -116,7 +302,6 @@ class DependencyManager:
             If the manifest is not found, return a Result
             object with the error.
             '''
-            GLib.idle_add(self.__operation_manager.remove_task, task_id)
             return Result(
                 status=False,
                 message=f"Cannot find manifest for {dependency[0]}."
@@ -128,7 +313,7 @@ class DependencyManager:
             before installing the current one.
             '''
             for _ext_dep in manifest.get("Dependencies"):
-                if _ext_dep in config["Installed_Dependencies"]:
+                if _ext_dep in (config.get("Installed_Dependencies") or []):
                     continue
                 if _ext_dep in self.__manager.supported_dependencies:
                     _dep = self.__manager.supported_dependencies[_ext_dep]
@@ -136,32 +321,35 @@ class DependencyManager:
                     if not _res.status:
                         return _res
 
-        for step in manifest.get("Steps"):
+        bottle_path = ManagerUtils.get_bottle_path(config)
+
+        steps = _compile_steps(manifest.get("Steps"))
+
+        for level in self.__get_step_levels(config, steps, bottle_path):
             '''
             Here we execute all steps in the manifest.
             Steps are the actions performed to install the dependency.
+            Steps in the same level are independent and run concurrently.
             '''
-            res = self.__perform_steps(config, step)
-            if not res.status:
-                GLib.idle_add(self.__operation_manager.remove_task, task_id)
-                return Result(
-                    status=False,
-                    message=f"One or more steps failed for {dependency[0]}."
-                )
-            if not res.data.get("uninstaller"):
-                uninstaller = False
-
-        if dependency[0] not in config.get("Installed_Dependencies") \
-                or reinstall:
+            for res in self.__perform_level(config, level, bottle_path):
+                if not res.status:
+                    return Result(
+                        status=False,
+                        message=f"One or more steps failed for {dependency[0]}."
+                    )
+                if not res.data.get("uninstaller"):
+                    uninstaller = False
+
+        dependencies = config.get("Installed_Dependencies") or []
+        is_installed = dependency[0] in dependencies
+
+        if not is_installed or reinstall:
             '''
             If the dependency is not already listed in the installed
             dependencies list of the bottle, add it.
             '''
-            dependencies = [dependency[0]]
-
-            if config.get("Installed_Dependencies"):
-                dependencies = config["Installed_Dependencies"] + \
-                               [dependency[0]]
+            if not is_installed:
+                dependencies.append(dependency[0])
 
             self.__manager.update_config(
                 config=config,
@@ -185,9 +373,6 @@ class DependencyManager:
                 "Uninstallers"
             )
 
-        # Remove entry from operation manager
-        GLib.idle_add(self.__operation_manager.remove_task, task_id)
-
         # Hide installation button and show remove button
         logging.info(f"Dependency installed: {dependency[0]} in {config['Name']}", jn=True)
         if not uninstaller:
@@ -200,103 +385,146 @@ class DependencyManager:
             data={"uninstaller": True}
         )
 
-    def __perform_steps(
-            self,
-            config: dict,
-            step: dict
-    ) -> bool:
+    def __get_step_io(self, config: dict, step: Step, bottle_path: str) -> Union[tuple, None]:
         """
-        This method execute a step in the bottle (e.g. changing the Windows
-        version, installing fonts, etc.)
-        ---
-        Returns True if the dependency cannot be uninstalled.
+        Return the directories read and the (directory, file) pairs written
+        by a step which only copies or deletes files, using the real paths
+        the step resolves to. Returns None for any other step, or if its
+        destination cannot be resolved, which must then run alone (e.g.
+        installers, registry edits, extractions).
         """
-        uninstaller = True
-
-        if step["action"] == "delete_dlls":
-            self.__step_delete_dlls(config, step)
-
-        if step["action"] == "download_archive":
-            if not self.__step_download_archive(step):
-                return Result(status=False)
-
-        if step["action"] in ["install_exe", "install_msi"]:
-            if not self.__step_install_exe_msi(config=config, step=step):
-                return Result(status=False)
-
-        if step["action"] == "uninstall":
-            self.__step_uninstall(config=config, file_name=step["file_name"])
+        action = step.action
 
-        if step["action"] == "cab_extract":
-            uninstaller = False
-            if not self.__step_cab_extract(step=step):
-                return Result(status=False)
+        def split(dest, file):
+            return os.path.split(os.path.normpath(os.path.join(dest, file)))
 
-        if step["action"] == "get_from_cab":
-            uninstaller = False
-            if not self.__step_get_from_cab(config=config, step=step):
-                return Result(status=False)
+        if action in ["copy_dll", "copy_file"]:
+            dest = step.dest and self.__get_real_dest(config, step.dest, bottle_path)
+            if not isinstance(dest, str) or not step.path or not step.file_name:
+                return None
 
-        if step["action"] == "archive_extract":
-            uninstaller = False
-            if not self.__step_archive_extract(step):
-                return Result(status=False)
+            _dir = os.path.dirname(step.file_name)
+            reads = [os.path.normpath(os.path.join(step.path, _dir))]
+            if "*" in step.file_name:
+                # wildcard matches are copied to dest/<basename>
+                writes = [split(dest, os.path.basename(step.file_name))]
+            else:
+                writes = [split(dest, step.file_name)]
+        elif action in ["install_cab_fonts", "install_fonts"]:
+            if not step.path:
+                return None
+
+            font_path = f"{bottle_path}/drive_c/windows/Fonts"
+            reads = [os.path.normpath(step.path)]
+            writes = [split(font_path, f) for f in step.fonts or []]
+        elif action == "delete_dlls":
+            dest = step.dest and self.__get_real_dest(config, step.dest, bottle_path)
+            if not isinstance(dest, str):
+                return None
+
+            reads = []
+            writes = [split(dest, d) for d in step.dlls or []]
+        else:
+            return None
 
-        if step["action"] in ["install_cab_fonts", "install_fonts"]:
-            uninstaller = False
-            if not self.__step_install_fonts(config=config, step=step):
-                return Result(status=False)
+        return reads, writes
 
-        if step["action"] in ["copy_dll", "copy_file"]:
-            uninstaller = False
-            if not self.__step_copy_dll(config=config, step=step):
-                return Result(status=False)
+    @staticmethod
+    def __steps_conflict(io_a: tuple, io_b: tuple) -> bool:
+        """Check if two steps touch the same files or directories."""
+        reads_a, writes_a = io_a
+        reads_b, writes_b = io_b
 
-        if step["action"] == "register_dll":
-            self.__step_register_dll(
-                config=config,
-                step=step
-            )
+        for dest_a, file_a in writes_a:
+            if dest_a in reads_b:
+                return True
+            for dest_b, file_b in writes_b:
+                if dest_b in reads_a:
+                    return True
+                if dest_a == dest_b and (
+                        fnmatch.fnmatchcase(file_a, file_b)
+                        or fnmatch.fnmatchcase(file_b, file_a)
+                ):
+                    return True
 
-        if step["action"] == "set_register_key":
-            self.__step_set_register_key(
-                config=config,
-                step=step
-            )
+        return False
 
-        if step["action"] == "register_font":
-            self.__step_register_font(
-                config=config,
-                step=step
-            )
+    def __get_step_levels(self, config: dict, steps: list, bottle_path: str) -> list:
+        """
+        Split the manifest steps in levels which must be executed in
+        order. Steps which cannot run concurrently are placed alone in
+        their own level, acting as a barrier. Between two barriers, each
+        step is placed in the level following the last one it conflicts
+        with, so that independent steps share the same level.
+        """
+        levels = []
+        segment = []
+
+        def flush():
+            _levels = []
+            for _step, _io, _level in segment:
+                if _level == len(_levels):
+                    _levels.append([])
+                _levels[_level].append(_step)
+            levels.extend(_levels)
+            segment.clear()
+
+        for step in steps:
+            io = self.__get_step_io(config, step, bottle_path)
+            if io is None:
+                flush()
+                levels.append([step])
+                continue
+
+            level = 0
+            for _step, _io, _level in segment:
+                if _level >= level and self.__steps_conflict(_io, io):
+                    level = _level + 1
+            segment.append((step, io, level))
+
+        flush()
+        return levels
+
+    def __perform_level(self, config: dict, level: list, bottle_path: str) -> list:
+        """
+        Execute the steps of a level, concurrently if there is
+        more than one, and return their results in order.
+        """
+        if len(level) == 1:
+            return [self.__perform_steps(config, level[0], bottle_path)]
 
-        if step["action"] == "replace_font":
-            self.__step_replace_font(
-                config=config,
-                step=step
-            )
+        with ThreadPoolExecutor(max_workers=min(len(level), 8)) as executor:
+            return list(executor.map(
+                lambda step: self.__perform_steps(config, step, bottle_path), level
+            ))
 
-        if step["action"] == "set_windows":
-            self.__step_set_windows(
-                config=config,
-                step=step
-            )
+    def __perform_steps(
+            self,
+            config: dict,
+            step: Step,
+            bottle_path: str
+    ) -> Result:
+        """
+        This method execute a step in the bottle (e.g. changing the Windows
+        version, installing fonts, etc.)
+        ---
+        Returns a Result with the uninstaller data set to False if the
+        dependency cannot be uninstalled.
+        """
+        action = step.action
+        handler = self.__step_dispatch.get(action)
 
-        if step["action"] == "use_windows":
-            self.__step_use_windows(
-                config=config,
-                step=step
-            )
+        if handler and not handler(config=config, step=step, bottle_path=bottle_path):
+            return Result(status=False)
 
         return Result(
             status=True,
-            data={"uninstaller": uninstaller}
+            data={"uninstaller": action not in self.__no_uninstaller_actions}
         )
 
     @staticmethod
-    def __get_real_dest(config: dict, dest: str) -> Union[str, bool]:
+    def __get_real_dest(config: dict, dest: str, bottle: str) -> Union[str, bool]:
         """This function return the real destination path."""
-        bottle = ManagerUtils.get_bottle_path(config)
         _dest = dest
 
         if dest.startswith("temp/"):
@@ -320,7 +548,7 @@ class DependencyManager:
 
         return dest
 
-    def __step_download_archive(self, step: dict):
+    def __step_download_archive(self, config: dict, step: Step, **kwargs):
         """
         This function download an archive from the given step.
         Can be used for any file type (cab, zip, ...). Please don't
@@ -328,41 +556,40 @@ class DependencyManager:
         download the exe/msi file before installation.
         """
         download = self.__manager.component_manager.download(
-            download_url=step.get("url"),
-            file=step.get("file_name"),
-            rename=step.get("rename"),
-            checksum=step.get("file_checksum")
+            download_url=step.url,
+            file=step.file_name,
+            rename=step.rename,
+            checksum=step.file_checksum
         )
 
         return download
 
-    def __step_install_exe_msi(self, config: dict, step: dict) -> bool:
+    def __step_install_exe_msi(self, config: dict, step: Step, **kwargs) -> bool:
         """
         Download and install the .exe or .msi file
         declared in the step, in a bottle.
         """
         winedbg = WineDbg(config)
         download = self.__manager.component_manager.download(
-            download_url=step.get("url"),
-            file=step.get("file_name"),
-            rename=step.get("rename"),
-            checksum=step.get("file_checksum")
+            download_url=step.url,
+            file=step.file_name,
+            rename=step.rename,
+            checksum=step.file_checksum
         )
-        file = step.get("file_name")
-        if step.get("rename"):
-            file = step.get("rename")
+        file = step.file_name
+        if step.rename:
+            file = step.rename
 
         if download:
-            if step.get("url").startswith("temp/"):
-                _file = step.get("url").replace("temp/", f"{Paths.temp}/")
-                file = f"{_file}/{file}"
+            if step.url.startswith("temp/"):
+                file = f"{step.path}/{file}"
             else:
                 file = f"{Paths.temp}/{file}"
             executor = WineExecutor(
                 config,
                 exec_path=file,
-                args=step.get("arguments"),
-                environment=step.get("environment")
+                args=step.arguments,
+                environment=step.environment
             )
             executor.run()
             winedbg.wait_for_process(file)
@@ -371,83 +598,76 @@ class DependencyManager:
         return False
 
     @staticmethod
-    def __step_uninstall(config: dict, file_name: str) -> bool:
+    def __step_uninstall(config: dict, step: Step, **kwargs) -> bool:
         """
         This function find an uninstaller in the bottle by the given
         file name and execute it.
         """
-        Uninstaller(config).from_name(file_name)
+        Uninstaller(config).from_name(step.file_name)
         return True
 
-    def __step_cab_extract(self, step: dict):
+    def __step_cab_extract(self, config: dict, step: Step, **kwargs):
         """
         This function download and extract a Windows Cabinet to the
         temp folder.
         """
-        dest = step.get("dest")
+        dest = step.dest
         if dest.startswith("temp/"):
             dest = dest.replace("temp/", f"{Paths.temp}/")
         else:
             logging.error("Destination path not supported!")
             return False
 
-        if validate_url(step["url"]):
+        file = step.rename or step.file_name
+
+        if validate_url(step.url):
             download = self.__manager.component_manager.download(
-                download_url=step.get("url"),
-                file=step.get("file_name"),
-                rename=step.get("rename"),
-                checksum=step.get("file_checksum")
+                download_url=step.url,
+                file=step.file_name,
+                rename=step.rename,
+                checksum=step.file_checksum
             )
 
-            if download:
-                if step.get("rename"):
-                    file = step.get("rename")
-                else:
-                    file = step.get("file_name")
-
-                if not CabExtract().run(
-                        path=os.path.join(Paths.temp, file),
-                        name=file,
-                        destination=dest
-                ):
-                    return False
+            if not download:
+                return True
 
-        elif step["url"].startswith("temp/"):
-            path = step["url"]
-            path = path.replace("temp/", f"{Paths.temp}/")
+            path = os.path.join(Paths.temp, file)
+            name = file
 
-            if step.get("rename"):
-                file_path = os.path.splitext(
-                    f"{step.get('rename')}")[0]
-            else:
-                file_path = os.path.splitext(
-                    f"{step.get('file_name')}")[0]
+        elif step.url.startswith("temp/"):
+            path = f"{step.path}/{step.file_name}"
+            name = os.path.splitext(file)[0]
 
-            if not CabExtract().run(
-                    f"{path}/{step.get('file_name')}",
-                    file_path
-            ):
-                return False
+        else:
+            return True
 
-        return True
+        return CabExtract().run(
+            path=path,
+            name=name,
+            destination=dest
+        )
 
-    def __step_delete_dlls(self, config: dict, step: dict):
+    def __step_delete_dlls(self, config: dict, step: Step, bottle_path: str, **kwargs):
         """Deletes the given dlls from the system32 or syswow64 paths"""
-        dest = self.__get_real_dest(config, step.get("dest"))
+        dest = self.__get_real_dest(config, step.dest, bottle_path)
 
-        for d in step.get("dlls", []):
-            _d = os.path.join(dest, d)
-            if os.path.exists(_d):
-                os.remove(_d)
+        if isinstance(dest, bool):
+            return dest
+
+        for d in step.dlls or []:
+            try:
+                os.remove(os.path.join(dest, d))
+            except FileNotFoundError:
+                pass
 
         return True
 
-    def __step_get_from_cab(self, config: dict, step: dict):
+    def __step_get_from_cab(self, config: dict, step: Step, bottle_path: str, **kwargs):
         """Take a file from a cabiner and extract to a path."""
-        source = step.get("source")
-        file_name = step.get("file_name")
-        rename = step.get("rename")
-        dest = self.__get_real_dest(config, step.get("dest"))
+        source = step.source
+        file_name = step.file_name
+        rename = step.rename
+        dest = self.__get_real_dest(config, step.dest, bottle_path)
 
         if isinstance(dest, bool):
             return dest
@@ -473,20 +693,20 @@ class DependencyManager:
             return False
         return True
 
-    def __step_archive_extract(self, step: dict):
+    def __step_archive_extract(self, config: dict, step: Step, **kwargs):
         """Download and extract an archive to the temp folder."""
         download = self.__manager.component_manager.download(
-            download_url=step.get("url"),
-            file=step.get("file_name"),
-            rename=step.get("rename"),
-            checksum=step.get("file_checksum")
+            download_url=step.url,
+            file=step.file_name,
+            rename=step.rename,
+            checksum=step.file_checksum
         )
 
         if download:
-            if step.get("rename"):
-                file = step.get("rename")
+            if step.rename:
+                file = step.rename
             else:
-                file = step.get("file_name")
+                file = step.file_name
 
             archive_path = os.path.join(Paths.temp, os.path.splitext(file)[0])
 
@@ -505,69 +725,75 @@ class DependencyManager:
 
         return False
 
-    @staticmethod
-    def __step_install_fonts(config: dict, step: dict):
-        """Move fonts to the drive_c/windows/Fonts path."""
-        path = step["url"]
-        path = path.replace("temp/", f"{Paths.temp}/")
-        bottle_path = ManagerUtils.get_bottle_path(config)
+    def __copy_files(self, copy: Callable, files: list):
+        """
+        Call copy for each of the given files. Copies are independent and
+        I/O bound, so more than one file is copied using the shared workers.
+        """
+        if len(files) == 1:
+            copy(files[0])
+            return
 
-        for font in step.get('fonts'):
-            font_path = f"{bottle_path}/drive_c/windows/Fonts/"
-            if not os.path.exists(font_path):
-                os.makedirs(font_path)
+        list(self.__copy_executor.map(copy, files))
 
+    def __step_install_fonts(self, config: dict, step: Step, bottle_path: str, **kwargs):
+        """Move fonts to the drive_c/windows/Fonts path."""
+        path = step.path
+        font_path = f"{bottle_path}/drive_c/windows/Fonts/"
+        os.makedirs(font_path, exist_ok=True)
+
+        def copy(font):
             try:
                 shutil.copyfile(f"{path}/{font}", f"{font_path}/{font}")
             except (FileNotFoundError, FileExistsError):
                 logging.warning(f"Font {font} already exists or is not found.")
 
-            # print(f"Copying {font} to {bottle_path}/drive_c/windows/Fonts/")
+        self.__copy_files(copy, step.fonts or [])
 
         return True
 
     # noinspection PyTypeChecker
-    def __step_copy_dll(self, config: dict, step: dict):
+    def __step_copy_dll(self, config: dict, step: Step, bottle_path: str, **kwargs):
         """
         This function copy dlls from temp folder to a directory
         declared in the step. The bottle drive_c path will be used as
         root path.
         """
-        path = step["url"]
-        path = path.replace("temp/", f"{Paths.temp}/")
-        dest = self.__get_real_dest(config, step.get("dest"))
+        path = step.path
+        dest = self.__get_real_dest(config, step.dest, bottle_path)
 
         if isinstance(dest, bool):
             return dest
 
+        def copy(entry):
+            _path, name = entry
+            _dest = os.path.join(dest, name)
+            logging.info(f"Copying {name} to {_dest}")
+
+            if os.path.exists(_dest) and os.path.islink(_dest):
+                os.unlink(_dest)
+
+            try:
+                shutil.copyfile(_path, _dest)
+            except shutil.SameFileError:
+                logging.info(f"{name} already exists at the same version, skipping.")
+
         try:
-            if "*" in step.get('file_name'):
-                files = glob(f"{path}/{step.get('file_name')}")
-                for fg in files:
-                    _name = fg.split("/")[-1]
-                    _path = os.path.join(path, _name)
-                    _dest = os.path.join(dest, _name)
-                    logging.info(f"Copying {_name} to {_dest}")
-
-                    if os.path.exists(_dest) and os.path.islink(_dest):
-                        os.unlink(_dest)
-
-                    try:
-                        shutil.copyfile(_path, _dest)
-                    except shutil.SameFileError:
-                        logging.info(f"{_name} already exists at the same version, skipping.")
+            if "*" in step.file_name:
+                _dir, pattern = os.path.split(step.file_name)
+                _path = os.path.join(path, _dir)
+                files = []
+                if os.path.isdir(_path):
+                    with os.scandir(_path) as it:
+                        files = [
+                            (e.path, e.name) for e in it
+                            if fnmatch.fnmatchcase(e.name, pattern)
+                        ]
             else:
-                _name = step.get('file_name')
-                _dest = os.path.join(dest, _name)
-                logging.info(f"Copying {_name} to {_dest}")
-
-                if os.path.exists(_dest) and os.path.islink(_dest):
-                    os.unlink(_dest)
+                _name = step.file_name
+                files = [(os.path.join(path, _name), _name)]
 
-                try:
-                    shutil.copyfile(os.path.join(path, _name), _dest)
-                except shutil.SameFileError:
-                    logging.info(f"{_name} already exists at the same version, skipping.")
+            self.__copy_files(copy, files)
 
         except Exception as e:
             print(e)
@@ -577,98 +803,97 @@ class DependencyManager:
         return True
 
     @staticmethod
-    def __step_register_dll(config: dict, step: dict):
+    def __step_register_dll(config: dict, step: Step, **kwargs):
         """Register one or more dll and ActiveX control"""
         regsvr32 = Regsvr32(config)
 
-        for dll in step.get('dlls', []):
+        for dll in step.dlls or []:
             regsvr32.register(dll)
 
         return True
 
     @staticmethod
-    def __step_override_dll(config: dict, step: dict):
+    def __step_override_dll(config: dict, step: Step, **kwargs):
         """Register a new override for each dll."""
         reg = Reg(config)
 
-        if step.get("url") and step.get("url").startswith("temp/"):
-            path = step["url"].replace("temp/", f"{Paths.temp}/")
-            dlls = glob(os.path.join(path, step.get("dll")))
+        if step.url and step.url.startswith("temp/"):
+            dlls = glob(os.path.join(step.path, step.dll))
 
             for dll in dlls:
                 reg.add(
                     key="HKEY_CURRENT_USER\\Software\\Wine\\DllOverrides",
                     value=dll,
-                    data=step.get("type")
+                    data=step.type
                 )
             return True
 
-        if step.get("bundle"):
-            _bundle = {"HKEY_CURRENT_USER\\Software\\Wine\\DllOverrides": step.get("bundle")}
+        if step.bundle:
+            _bundle = {"HKEY_CURRENT_USER\\Software\\Wine\\DllOverrides": step.bundle}
             reg.import_bundle(_bundle)
             return True
 
         reg.add(
             key="HKEY_CURRENT_USER\\Software\\Wine\\DllOverrides",
-            value=step.get("dll"),
-            data=step.get("type")
+            value=step.dll,
+            data=step.type
         )
         return True
 
     @staticmethod
-    def __step_set_register_key(config: dict, step: dict):
+    def __step_set_register_key(config: dict, step: Step, **kwargs):
         """Set a registry key."""
         reg = Reg(config)
         reg.add(
-            key=step.get("key"),
-            value=step.get("value"),
-            data=step.get("data"),
-            key_type=step.get("type")
+            key=step.key,
+            value=step.value,
+            data=step.data,
+            key_type=step.type
         )
         return True
 
     @staticmethod
-    def __step_register_font(config: dict, step: dict):
+    def __step_register_font(config: dict, step: Step, **kwargs):
         """Register a font in the registry."""
         reg = Reg(config)
         reg.add(
             key="HKEY_LOCAL_MACHINE\\Software\\Microsoft\\Windows NT\\CurrentVersion\\Fonts",
-            value=step.get("name"),
-            data=step.get("file")
+            value=step.name,
+            data=step.file
         )
         return True
 
     @staticmethod
-    def __step_replace_font(config: dict, step: dict):
+    def __step_replace_font(config: dict, step: Step, **kwargs):
         """Register a font replacement in the registry."""
         reg = Reg(config)
-        replaces = step.get("replace")
+        replaces = step.replace
 
         if len(replaces) == 1:
             reg.add(
                 key="HKEY_CURRENT_USER\\Software\\Wine\\Fonts\\Replacements",
-                value=step.get("font"),
-                data=step.get("replace")
+                value=step.font,
+                data=step.replace
             )
         else:
             for r in replaces:
                 reg.add(
                     key="HKEY_CURRENT_USER\\Software\\Wine\\Fonts\\Replacements",
-                    value=step.get("font"),
+                    value=step.font,
                     data=r
                 )
         return True
 
     @staticmethod
-    def __step_set_windows(config: dict, step: dict):
+    def __step_set_windows(config: dict, step: Step, **kwargs):
         """Set the Windows version."""
         rk = RegKeys(config)
-        rk.set_windows(step.get("version"))
+        rk.set_windows(step.version)
         return True
 
     @staticmethod
-    def __step_use_windows(config: dict, step: dict):
+    def __step_use_windows(config: dict, step: Step, **kwargs):
         """Set a Windows version per program."""
         rk = RegKeys(config)
-        rk.set_app_default(step.get("version"), step.get("executable"))
+        rk.set_app_default(step.version, step.executable)
         return True
@@ -19,6 +19,7 @@ import os
 from bottles.backend.utils import yaml
 import uuid
 import shutil
+import threading
 import contextlib
 from pathlib import Path
 from datetime import datetime, timedelta
@@ -43,6 +44,7 @@ class JournalManager:
     _xdg_data_home = os.environ.get("XDG_DATA_HOME", f"{Path.home()}/.local/share")
     _base = f"{_xdg_data_home}/bottles"
     path = f"{_base}/journal.yml"
+    __lock = threading.Lock()
 
     @staticmethod
     def __get_journal() -> dict:
@@ -160,17 +162,19 @@ class JournalManager:
     @staticmethod
     def write(severity: JournalSeverity, message: str):
         """Write an event to the journal."""
-        journal = JournalManager.__get_journal()
         event_id = str(uuid.uuid4())
         now = datetime.now()
 
         if severity not in JournalSeverity.__dict__.values():
             severity = JournalSeverity.INFO
 
-        journal[event_id] = {
-            "severity": severity,
-            "message": message,
-            "timestamp": now.strftime("%Y-%m-%d %H:%M:%S")
-        }
-        JournalManager.__save_journal(journal)
-        JournalManager.__clean_old()
+        # events can be written from worker threads, serialize the updates
+        with JournalManager.__lock:
+            journal = JournalManager.__get_journal()
+            journal[event_id] = {
+                "severity": severity,
+                "message": message,
+                "timestamp": now.strftime("%Y-%m-%d %H:%M:%S")
+            }
+            JournalManager.__save_journal(journal)
+            JournalManager.__clean_old()
@@ -294,7 +294,7 @@ class Manager:
 
     def organize_dependencies(self):
         """Organizes dependencies into supported_dependencies."""
-        catalog = self.dependency_manager.fetch_catalog()
+        catalog = self.dependency_manager.fetch_catalog(prefetch_manifests=True)
         if len(catalog) == 0:
             logging.info("No dependencies found!")
             return
@@ -16,7 +16,11 @@
 #
 
 from bottles.backend.utils import yaml
+import copy
 import urllib.request
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as StreamError
 from http.client import RemoteDisconnected
 
 from bottles.backend.logger import Logger  # pyright: reportMissingImports=false
@@ -24,33 +28,89 @@ from bottles.backend.logger import Logger  # pyright: reportMissingImports=false
 logging = Logger()
 
 
+def _new_session() -> requests.Session:
+    """
+    Return a session which keeps the connections to the repositories
+    alive, so the TLS handshake is done once for all the requests.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
 class Repo:
     name: str = ""
+    __documents = {}
+    __session = _new_session()
 
     def __init__(self, url: str, index: str, offline: bool = False):
         self.url = url
         self.catalog = self.__get_catalog(index, offline)
 
+    @staticmethod
+    def __fetch(url: str, plain: bool = False):
+        """
+        Fetch a YAML document and load it, or return it as text if plain
+        is True. Documents are kept with their ETag/Last-Modified headers,
+        so the next request is conditional and a 304 Not Modified response
+        reuses the cached document without downloading or parsing it.
+        Cached documents are shared by all Repo instances, so callers always
+        get their own copy.
+        """
+        if not url.startswith(("http://", "https://")):
+            # local repositories (file://) are not cached
+            with urllib.request.urlopen(url) as u:
+                if plain:
+                    return u.read().decode("utf-8")
+                return yaml.safe_load(u)
+
+        key = (url, plain)
+        cached = Repo.__documents.get(key)
+        headers = {}
+
+        if cached:
+            if cached[0]:
+                headers["If-None-Match"] = cached[0]
+            if cached[1]:
+                headers["If-Modified-Since"] = cached[1]
+
+        with Repo.__session.get(url, headers=headers, stream=True, timeout=30) as r:
+            if r.status_code == 304 and cached:
+                return copy.deepcopy(cached[2])
+            r.raise_for_status()
+
+            if plain:
+                res = r.content.decode("utf-8")
+            else:
+                r.raw.decode_content = True
+                res = yaml.safe_load(r.raw)
+
+            etag = r.headers.get("ETag")
+            last_modified = r.headers.get("Last-Modified")
+            if etag or last_modified:
+                Repo.__documents[key] = (etag, last_modified, copy.deepcopy(res))
+            return res
+
     def __get_catalog(self, index: str, offline: bool = False):
         if index in ["", None] or offline:
             return {}
 
         try:
-            with urllib.request.urlopen(index) as url:
-                index = yaml.load(url.read())
-                logging.info(f"Catalog {self.name} loaded")
-                return index
-        except (urllib.error.HTTPError, urllib.error.URLError, yaml.YAMLError):
+            index = self.__fetch(index)
+            logging.info(f"Catalog {self.name} loaded")
+            return index
+        except (urllib.error.URLError, requests.exceptions.RequestException, StreamError, yaml.YAMLError):
             logging.error(f"Cannot fetch {self.name} repository index.")
             return {}
 
     def get_manifest(self, url: str, plain: bool = False):
         try:
-            with urllib.request.urlopen(url) as u:
-                res = u.read()
-                if plain:
-                    return res.decode("utf-8")
-                return yaml.load(res)
-        except (urllib.error.HTTPError, urllib.error.URLError, RemoteDisconnected, yaml.YAMLError):
+            return self.__fetch(url, plain)
+        except (
+                urllib.error.URLError, RemoteDisconnected,
+                requests.exceptions.RequestException, StreamError, yaml.YAMLError
+        ):
             logging.error(f"Cannot fetch {self.name} manifest.")
             return
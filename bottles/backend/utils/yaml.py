@@ -1,8 +1,9 @@
 import yaml as _yaml
 try:
-    from yaml import CLoader as Loader, CDumper as Dumper
+    from yaml import CLoader as Loader, CSafeLoader as SafeLoader, CDumper as Dumper
     _c = True
 except ImportError:
+    from yaml import Loader, SafeLoader, Dumper
     _c = False
 
 
@@ -31,4 +32,14 @@ def load(stream, Loader=Loader):
     return _yaml.safe_load(stream)
 
 
-YAMLError = _yaml.YAMLError
\ No newline at end of file
+def safe_load(stream):
+    """
+    Load a YAML stream from an untrusted source (e.g. remote repositories).
+    Note: This function is a replacement for PyYAML's safe_load() function,
+          using the CSafeLoader class when libyaml is available, to achieve
+          best performance without allowing arbitrary Python objects.
+    """
+    return _yaml.load(stream, Loader=SafeLoader)
+
+
+YAMLError = _yaml.YAMLError
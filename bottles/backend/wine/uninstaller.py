@@ -11,12 +11,22 @@ class Uninstaller(WineProgram):
     command = "uninstaller"
 
     def get_uuid(self, name: str = None):
-        args = " --list"
-
-        if name is not None:
-            args = f"--list | grep -i '{name}' | cut -f1 -d\\|"
-
-        return self.launch(args=args, communicate=True, action_name="get_uuid")
+        res = self.launch(args="--list", communicate=True, action_name="get_uuid")
+
+        if name is None:
+            return res
+
+        if isinstance(res, bytes):
+            res = res.decode("utf-8", errors="replace")
+
+        # lines are in the form {uuid}|||name, filter them case-insensitively
+        name = name.lower()
+        uuids = [
+            line.split("|", 1)[0]
+            for line in (res or "").splitlines()
+            if name in line.lower()
+        ]
+        return "\n".join(uuids)
 
     def from_uuid(self, uuid: str = None):
         args = ""
@@ -228,13 +228,28 @@ class Bottles(Adw.Application):
         self.win = win
         win.present()
 
-    @staticmethod
-    def __quit(action=None, param=None):
+    def do_shutdown(self):
+        """
+        This function is called when the application is about to quit.
+        """
+        self.__stop_workers()
+        Adw.Application.do_shutdown(self)
+
+    def __stop_workers(self):
+        """
+        This function stops the background workers of the manager, so
+        they do not delay the application exit.
+        """
+        if self.win is not None and self.win.manager is not None:
+            self.win.manager.dependency_manager.shutdown()
+
+    def __quit(self, action=None, param=None):
         """
         This function close the application.
         It is used by the [Ctrl+Q] shortcut.
         """
         logging.info(_("[Quit] request received."), )
+        self.__stop_workers()
         quit()
 
     @staticmethod
@@ -297,9 +297,10 @@ class MainWindow(Adw.ApplicationWindow):
             self.disable_onboard = True
             DependenciesCheckDialog(self).present()
 
-    @staticmethod
-    def proper_close():
+    def proper_close(self):
         """Properly close Bottles"""
+        if self.manager is not None:
+            self.manager.dependency_manager.shutdown()
         quit()
 
     def show_about_dialog(self, *_args):